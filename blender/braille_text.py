@@ -1,51 +1,300 @@
+import math
+import re
+
+import bmesh
 import bpy
+import numpy as np
+
+# Raised dots of each character, ordered as dots 1-6 of the braille cell.
+BRAILLE_MAP = {
+    'a': [1,0,0,0,0,0], 'b': [1,1,0,0,0,0], 'c': [1,0,0,1,0,0], 'd': [1,0,0,1,1,0],
+    'e': [1,0,0,0,1,0], 'f': [1,1,0,1,0,0], 'g': [1,1,0,1,1,0], 'h': [1,1,0,0,1,0],
+    'i': [0,1,0,1,0,0], 'j': [0,1,0,1,1,0], 'k': [1,0,1,0,0,0], 'l': [1,1,1,0,0,0],
+    'm': [1,0,1,1,0,0], 'n': [1,0,1,1,1,0], 'o': [1,0,1,0,1,0], 'p': [1,1,1,1,0,0],
+    'q': [1,1,1,1,1,0], 'r': [1,1,1,0,1,0], 's': [0,1,1,1,0,0], 't': [0,1,1,1,1,0],
+    'u': [1,0,1,0,0,1], 'v': [1,1,1,0,0,1], 'w': [0,1,0,1,1,1], 'x': [1,0,1,1,0,1],
+    'y': [1,0,1,1,1,1], 'z': [1,0,1,0,1,1],
+    '1': [1,0,0,0,0,0], '2': [1,1,0,0,0,0], '3': [1,0,0,1,0,0], '4': [1,0,0,1,1,0],
+    '5': [1,0,0,0,1,0], '6': [1,1,0,1,0,0], '7': [1,1,0,1,1,0], '8': [1,1,0,0,1,0],
+    '9': [0,1,0,1,0,0], '0': [0,1,0,1,1,0],
+    'CAPS': [0,0,0,0,0,1],
+}
+
+# BRAILLE_MAP packed into one 6-bit mask per ASCII code, bit i being dot i + 1.
+BRAILLE_BITS = bytearray(128)
+for _char, _pattern in BRAILLE_MAP.items():
+    if len(_char) == 1:
+        BRAILLE_BITS[ord(_char)] = sum(bit << i for i, bit in enumerate(_pattern))
+CAPS_BITS = sum(bit << i for i, bit in enumerate(BRAILLE_MAP['CAPS']))
+
+# Words, single spaces and line breaks, in the order they appear.
+_TOKEN_RE = re.compile(r'[^ \n]+| |\n')
+
+# Longest ID name Blender keeps, in UTF-8 bytes.
+MAX_ID_NAME = 63
+
+# Depth each dot's rim is sunk into the base, relative to the dot height.
+DOT_SINK = 0.05
+
+# Tessellation of the dot dome.
+DOT_SEGMENTS = 48
+DOT_RING_COUNT = 24
+
+# Bump whenever _spin_dome changes shape, so meshes saved in older files are
+# not reused.
+_DOT_MESH_VERSION = 3
+
+# Name prefix of the dot meshes built by the current dome builder.
+_DOT_MESH_PREFIX = "BrailleDotMesh_v{}_{}x{}_".format(
+    _DOT_MESH_VERSION, DOT_SEGMENTS, DOT_RING_COUNT)
 
 def clear_scene():
     """
-    Remove all mesh objects from the current scene
-    to start fresh before generating Braille.
+    Remove all mesh objects from the current scene, and the meshes
+    they leave unused, to start fresh before generating Braille.
+    """
+    mesh_objs = [obj for obj in bpy.context.scene.objects if obj.type == 'MESH']
+    meshes = {obj.data for obj in mesh_objs}
+    bpy.data.batch_remove(mesh_objs)
+    # Meshes still used elsewhere are kept.
+    bpy.data.batch_remove([mesh for mesh in meshes if mesh.users == 0])
+    # Drop dot meshes of an older dome builder that nothing but their
+    # fake user, if any, still holds.
+    bpy.data.batch_remove([mesh for mesh in bpy.data.meshes
+                           if mesh.name.startswith("BrailleDotMesh_")
+                           and not mesh.name.startswith(_DOT_MESH_PREFIX)
+                           and mesh.users == int(mesh.use_fake_user)])
+    # Drop the collections of earlier runs once nothing is left in them.
+    bpy.data.batch_remove([coll for coll in bpy.data.collections
+                           if coll.get("braille_text") and not coll.all_objects
+                           and not coll.children])
+
+def _spin_dome(mesh, radius, height, segments, ring_count):
+    """
+    Fills a mesh with a dome-shaped braille dot by spinning its profile.
+
+    The profile is a quarter ellipse from the apex at ``height`` down to
+    a rim of the given radius sunk slightly below z=0 and closed by a
+    flat cap. The top face of the base then cuts through the dome's
+    lowest band of faces instead of touching its rim, so the union sees
+    a real crossing rather than coplanar geometry. The ring count is
+    that of the full sphere the dome is half of.
+
+    Args:
+        mesh (bpy.types.Mesh): Mesh to write the dome into.
+        radius (float): Base radius of the dome.
+        height (float): Height of the dome apex above its base.
+        segments (int): Number of vertical segments around the dome.
+        ring_count (int): Number of rings of the full sphere.
+    """
+    rings = ring_count // 2
+    sink = DOT_SINK * height
+    bm = bmesh.new()
+    profile = []
+    for ring in range(rings + 1):
+        t = math.pi / 2 * ring / rings
+        z = (height + sink) * math.cos(t) - sink
+        profile.append(bm.verts.new((radius * math.sin(t), 0.0, z)))
+    edges = [bm.edges.new(pair) for pair in zip(profile, profile[1:])]
+
+    bmesh.ops.spin(bm, geom=profile + edges, cent=(0.0, 0.0, 0.0),
+                   axis=(0.0, 0.0, 1.0), angle=2 * math.pi, steps=segments,
+                   use_merge=True)
+    # Collapse the copies of the apex into a single vertex.
+    bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=1e-5)
+    bmesh.ops.contextual_create(bm, geom=[e for e in bm.edges if e.is_boundary])
+    bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
+
+    bm.to_mesh(mesh)
+    bm.free()
+    mesh.polygons.foreach_set("use_smooth", np.ones(len(mesh.polygons), dtype=bool))
+    mesh.update()
+
+def _fill_mesh(mesh, co, loop_verts, loop_totals, smooth=False):
+    """
+    Writes raw vertex and polygon buffers into an empty mesh datablock.
+
+    Args:
+        mesh (bpy.types.Mesh): Mesh without any geometry.
+        co (numpy.ndarray): Flat float32 vertex coordinates.
+        loop_verts (numpy.ndarray): Vertex index of every face corner.
+        loop_totals (numpy.ndarray): Number of corners of every face.
+        smooth (bool): Whether the faces are shaded smooth.
+    """
+    loop_starts = np.zeros_like(loop_totals)
+    np.cumsum(loop_totals[:-1], out=loop_starts[1:])
+
+    mesh.vertices.add(len(co) // 3)
+    mesh.vertices.foreach_set("co", co)
+    mesh.loops.add(len(loop_verts))
+    mesh.loops.foreach_set("vertex_index", loop_verts)
+    mesh.polygons.add(len(loop_totals))
+    mesh.polygons.foreach_set("loop_start", loop_starts)
+    # Blender 4.0 derives the loop totals from the loop starts.
+    if bpy.app.version < (4, 0, 0):
+        mesh.polygons.foreach_set("loop_total", loop_totals)
+    if smooth:
+        mesh.polygons.foreach_set("use_smooth", np.ones(len(loop_totals), dtype=bool))
+    mesh.update(calc_edges=True)
+
+def get_dot_mesh(radius, height):
+    """
+    Returns the mesh shared by every braille dot of the given size.
+
+    The mesh is built on first use and looked up by name on later runs
+    of the same session. It has no fake user, so unused dot meshes are
+    not written to the .blend file. Its name encodes the builder
+    version, tessellation and dot size, so it is never taken from an
+    older builder.
+
+    Args:
+        radius (float): Base radius of the dome.
+        height (float): Height of the dome apex above its base.
+    Returns:
+        bpy.types.Mesh: Dome mesh with its base centered on the origin.
+    """
+    name = _DOT_MESH_PREFIX + "{:.5f}_{:.5f}".format(radius, height)
+    mesh = bpy.data.meshes.get(name)
+    if mesh is None:
+        mesh = bpy.data.meshes.new(name)
+        _spin_dome(mesh, radius, height, DOT_SEGMENTS, DOT_RING_COUNT)
+    return mesh
+
+def _mesh_arrays(mesh):
+    """
+    Reads the vertex and polygon buffers of a mesh datablock.
+
+    Args:
+        mesh (bpy.types.Mesh): Mesh to read.
+    Returns:
+        tuple: Flat vertex coordinates, loop vertex indices and polygon
+        loop totals, as numpy arrays.
+    """
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    return co, loop_verts, loop_totals
+
+def create_base_object(location, size, collection):
+    """
+    Builds the backing plate as a box mesh written in a single call.
+
+    Args:
+        location (tuple): Center of the box (x, y, z).
+        size (tuple): Width, depth and height of the box.
+        collection (bpy.types.Collection): Collection to link the object to.
+    Returns:
+        bpy.types.Object: Reference to the created base object.
     """
-    if bpy.ops.object.select_all.poll():
-        bpy.ops.object.select_all(action='DESELECT')
-    for obj in bpy.data.objects:
-        if obj.type == 'MESH':
-            obj.select_set(True)
-    if bpy.context.selected_objects:
-        bpy.ops.object.delete()
+    hx, hy, hz = (dim / 2 for dim in size)
+    # Vertex 4 * ix + 2 * iy + iz sits on the max side of each axis set to 1.
+    verts = [(x, y, z) for x in (-hx, hx) for y in (-hy, hy) for z in (-hz, hz)]
+    faces = [(0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1),
+             (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3)]
+
+    mesh = bpy.data.meshes.new("BrailleBase")
+    mesh.from_pydata(verts, [], faces)
+    mesh.update()
 
-def create_braille_dot(location, radius, height):
+    base_obj = bpy.data.objects.new("BrailleBase", mesh)
+    base_obj.location = location
+    collection.objects.link(base_obj)
+
+    return base_obj
+
+def create_dots_object(locations, dot_mesh, collection):
     """
-    Creates a dome-shaped braille dot using a bisected UV sphere.
+    Builds a single object holding one copy of the dot mesh per location.
 
     Args:
-        location (tuple): Center position of the dot base (x, y, z).
-        radius (float): Base radius of the sphere.
-        height (float): Final height after Z scaling.
+        locations (list): Center positions of the dot bases (x, y, z).
+        dot_mesh (bpy.types.Mesh): Mesh returned by ``get_dot_mesh``.
+        collection (bpy.types.Collection): Collection to link the object to.
     Returns:
-        bpy.types.Object: Reference to the created dot object.
+        bpy.types.Object: Reference to the created dots object.
+    """
+    co, loop_verts, loop_totals = _mesh_arrays(dot_mesh)
+    locations = np.asarray(locations, dtype=np.float32).reshape(-1, 1, 3)
+    copies = np.arange(len(locations), dtype=np.int32)[:, None]
+
+    mesh = bpy.data.meshes.new("BrailleDots")
+    _fill_mesh(mesh,
+               (co.reshape(1, -1, 3) + locations).ravel(),
+               (loop_verts + copies * (len(co) // 3)).ravel(),
+               np.tile(loop_totals, len(locations)),
+               smooth=True)
+
+    dots_obj = bpy.data.objects.new("BrailleDots", mesh)
+    collection.objects.link(dots_obj)
+
+    return dots_obj
+
+def _is_manifold(mesh):
     """
-    bpy.ops.mesh.primitive_uv_sphere_add(
-        segments=32, ring_count=16, radius=radius, location=location
-    )
-    dot_obj = bpy.context.active_object
-    dot_obj.name = "BrailleDot"
+    Checks that a mesh is a closed manifold, every edge being shared by
+    exactly two faces.
 
-    bpy.ops.object.mode_set(mode='EDIT')
-    bpy.ops.mesh.select_all(action='SELECT')
-    bpy.ops.mesh.bisect(
-        plane_co=location, plane_no=(0, 0, 1), clear_inner=True
-    )
-    bpy.ops.object.mode_set(mode='OBJECT')
+    Args:
+        mesh (bpy.types.Mesh): Mesh to check.
+    Returns:
+        bool: True if every edge of the mesh is manifold.
+    """
+    edge_index = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("edge_index", edge_index)
+    uses = np.bincount(edge_index, minlength=len(mesh.edges))
+    return bool((uses == 2).all())
 
-    for vert in dot_obj.data.vertices:
-        if vert.co.z > 0:
-            vert.co.z *= (height / radius)
+def _layout(text, cell_spacing_x, line_spacing_y):
+    """
+    Lays out the braille cells of a text in a single pass over its tokens.
 
-    modifier = dot_obj.modifiers.new(name="Subdivision", type='SUBSURF')
-    modifier.levels = 1
-    modifier.render_levels = 1
+    Every space takes an empty cell, and so does a line that is empty or
+    ends with a space. Capitalised words get one capital sign in front,
+    fully uppercase words two.
 
-    return dot_obj
+    Args:
+        text (str): Text string to be converted. Use '\\n' for new lines.
+        cell_spacing_x (float): Spacing between braille cells.
+        line_spacing_y (float): Spacing between lines of braille.
+    Returns:
+        tuple: (N, 3) float32 array of (x, y, mask) rows for the cells
+        with raised dots, the cell count of the longest line and the
+        number of lines.
+    """
+    cells = []
+    row = col = max_cols = 0
+    after_word = False
+
+    for token in _TOKEN_RE.findall(text + '\n'):
+        if token == ' ':
+            col += 1
+            after_word = False
+        elif token == '\n':
+            if not after_word:
+                col += 1
+            max_cols = max(max_cols, col)
+            col = 0
+            row += 1
+            after_word = False
+        else:
+            caps = 2 if token.isupper() and len(token) > 1 else int(token[0].isupper())
+            for _ in range(caps):
+                cells.append((col, row, CAPS_BITS))
+                col += 1
+            for c in token.lower():
+                mask = BRAILLE_BITS[ord(c)] if c < '\x80' else 0
+                if mask:
+                    cells.append((col, row, mask))
+                col += 1
+            after_word = True
+
+    layout = np.array(cells, dtype=np.float32).reshape(-1, 3)
+    layout[:, 0] *= cell_spacing_x
+    layout[:, 1] *= -line_spacing_y
+    return layout, max_cols, row
 
 def generate_braille_text(text_input="Hello", dot_radius=0.5, dot_height=0.5,
                           dot_spacing_x=2.5, dot_spacing_y=2.5,
@@ -57,7 +306,7 @@ def generate_braille_text(text_input="Hello", dot_radius=0.5, dot_height=0.5,
     Args:
         text_input (str): Text string to be converted. Use '\\n' for new lines.
         dot_radius (float): Radius of individual dots.
-        dot_height (float): Height of the dots (via Z-scaling).
+        dot_height (float): Height of the dots above the base plate.
         dot_spacing_x (float): Horizontal distance between dot columns.
         dot_spacing_y (float): Vertical distance between dot rows.
         cell_spacing_x (float): Spacing between braille cells.
@@ -68,73 +317,19 @@ def generate_braille_text(text_input="Hello", dot_radius=0.5, dot_height=0.5,
     """
     clear_scene()
 
-    braille_map = {
-        'a': [1,0,0,0,0,0], 'b': [1,1,0,0,0,0], 'c': [1,0,0,1,0,0], 'd': [1,0,0,1,1,0],
-        'e': [1,0,0,0,1,0], 'f': [1,1,0,1,0,0], 'g': [1,1,0,1,1,0], 'h': [1,1,0,0,1,0],
-        'i': [0,1,0,1,0,0], 'j': [0,1,0,1,1,0], 'k': [1,0,1,0,0,0], 'l': [1,1,1,0,0,0],
-        'm': [1,0,1,1,0,0], 'n': [1,0,1,1,1,0], 'o': [1,0,1,0,1,0], 'p': [1,1,1,1,0,0],
-        'q': [1,1,1,1,1,0], 'r': [1,1,1,0,1,0], 's': [0,1,1,1,0,0], 't': [0,1,1,1,1,0],
-        'u': [1,0,1,0,0,1], 'v': [1,1,1,0,0,1], 'w': [0,1,0,1,1,1], 'x': [1,0,1,1,0,1],
-        'y': [1,0,1,1,1,1], 'z': [1,0,1,0,1,1],
-        '1': [1,0,0,0,0,0], '2': [1,1,0,0,0,0], '3': [1,0,0,1,0,0], '4': [1,0,0,1,1,0],
-        '5': [1,0,0,0,1,0], '6': [1,1,0,1,0,0], '7': [1,1,0,1,1,0], '8': [1,1,0,0,1,0],
-        '9': [0,1,0,1,0,0], '0': [0,1,0,1,1,0],
-        'CAPS': [0,0,0,0,0,1],
-    }
-
-    dot_positions = [
+    dot_positions = np.array([
         (0, 2 * dot_spacing_y), (0, dot_spacing_y), (0, 0),
         (dot_spacing_x, 2 * dot_spacing_y), (dot_spacing_x, dot_spacing_y), (dot_spacing_x, 0)
-    ]
-
-    all_dots = []
-
-    def add_cell(pattern, x, y):
-        for i in range(6):
-            if pattern[i]:
-                dx, dy = dot_positions[i]
-                loc = (x + dx, y + dy, base_height / 2)
-                dot = create_braille_dot(loc, dot_radius, dot_height)
-                all_dots.append(dot)
-
-    current_y = 0.0
-    max_cells = 0
-    lines = text_input.split('\n')
-    num_lines = len(lines)
-
-    for line in lines:
-        current_x = 0.0
-        cells = 0
-        words = line.split(' ')
-
-        for word_index, word in enumerate(words):
-            if not word:
-                current_x += cell_spacing_x
-                cells += 1
-                continue
-
-            if word.isupper() and len(word) > 1:
-                for _ in range(2):
-                    add_cell(braille_map['CAPS'], current_x, current_y)
-                    current_x += cell_spacing_x
-                    cells += 1
-            elif word and word[0].isupper():
-                add_cell(braille_map['CAPS'], current_x, current_y)
-                current_x += cell_spacing_x
-                cells += 1
-
-            for char in word.lower():
-                pattern = braille_map.get(char, [0,0,0,0,0,0])
-                add_cell(pattern, current_x, current_y)
-                current_x += cell_spacing_x
-                cells += 1
-
-            if word_index < len(words) - 1:
-                current_x += cell_spacing_x
-                cells += 1
-
-        max_cells = max(max_cells, cells)
-        current_y -= line_spacing_y
+    ], dtype=np.float32)
+
+    layout, max_cells, num_lines = _layout(text_input, cell_spacing_x, line_spacing_y)
+
+    # Place the six dot slots of every cell at once, keeping the raised ones
+    masks = layout[:, 2].astype(np.uint8)
+    raised = ((masks[:, None] >> np.arange(6, dtype=np.uint8)) & 1).astype(bool)
+    dot_xy = (layout[:, None, :2] + dot_positions)[raised]
+    dot_locations = np.column_stack(
+        (dot_xy, np.full(len(dot_xy), base_height / 2, dtype=np.float32)))
 
     if max_cells == 0:
         return
@@ -153,35 +348,56 @@ def generate_braille_text(text_input="Hello", dot_radius=0.5, dot_height=0.5,
     center_y = (top_y + bottom_y) / 2
     center_z = 0
 
+    # Keep the generated objects together in a collection named after the text
+    safe_name = text_input.strip().replace('\n', ' ')
+    safe_name = safe_name.encode()[:MAX_ID_NAME].decode(errors='ignore')
+    scene_collection = bpy.context.scene.collection
+    collection = bpy.data.collections.get(safe_name)
+    if (collection is None or not collection.get("braille_text")
+            or collection not in scene_collection.children_recursive):
+        collection = bpy.data.collections.new(safe_name)
+        collection["braille_text"] = True
+        scene_collection.children.link(collection)
+
     # Add base cube
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(center_x, center_y, center_z))
-    base = bpy.context.active_object
-    base.name = "BrailleBase"
-    base.scale = (base_width, base_depth, base_height)
-
-    # Join all dots into one object
-    bpy.ops.object.select_all(action='DESELECT')
-    for dot in all_dots:
-        dot.select_set(True)
-    bpy.context.view_layer.objects.active = all_dots[0]
-    bpy.ops.object.join()
-    dots_joined = bpy.context.active_object
-    dots_joined.name = "BrailleDots"
+    base = create_base_object((center_x, center_y, center_z),
+                              (base_width, base_depth, base_height), collection)
+
+    # Build all dots as one object
+    dot_mesh = get_dot_mesh(dot_radius, dot_height)
+    dots_joined = create_dots_object(dot_locations, dot_mesh, collection)
 
     # Apply boolean union modifier to base with all dots at once
     bool_mod = base.modifiers.new(name="BoolUnion", type='BOOLEAN')
     bool_mod.operation = 'UNION'
     bool_mod.object = dots_joined
-    bool_mod.solver = 'EXACT'
-
-    bpy.context.view_layer.objects.active = base
-    bpy.ops.object.modifier_apply(modifier=bool_mod.name)
+    # Each closed dot crosses the top face through the interior of its lowest
+    # faces and no two dots touch, so the FAST solver sees no coplanar input.
+    bool_mod.solver = 'FAST'
+
+    # Evaluate the FAST union once and keep it. FAST can return broken
+    # geometry without raising an error, so fall back to the robust solver
+    # unless its union is a closed manifold.
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    union = bpy.data.meshes.new_from_object(base.evaluated_get(depsgraph))
+    if _is_manifold(union):
+        base_mesh = base.data
+        base.modifiers.remove(bool_mod)
+        base.data = union
+        bpy.data.meshes.remove(base_mesh)
+        union.name = "BrailleBase"
+    else:
+        bpy.data.meshes.remove(union)
+        bool_mod.solver = 'EXACT'
+        bpy.context.view_layer.objects.active = base
+        bpy.ops.object.modifier_apply(modifier=bool_mod.name)
 
     # Remove dots joined object
+    dots_mesh = dots_joined.data
     bpy.data.objects.remove(dots_joined, do_unlink=True)
+    bpy.data.meshes.remove(dots_mesh)
 
     # Rename base to original text
-    safe_name = text_input.strip().replace('\n', ' ')[:100]
     base.name = safe_name
 
 